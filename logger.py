@@ -1,6 +1,14 @@
+import atexit
+import io
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
 import time
+import traceback
+import weakref
 from datetime import datetime 
 
 """
@@ -16,13 +24,25 @@ from datetime import datetime
     Logging Architecture:
     --------------------
     Each application run generates a unique timestamped directory under `logs/` with the format
-    `run_YYYY-MM-DD_HH-MM-SS`, containing four specialized log files:
+    `run_YYYY-MM-DD_HH-MM-SS`, containing four specialized log files. The directory and loggers
+    are created lazily, the first time `LOG_DIR` or one of the loggers is accessed, so a bare
+    `import logger` does not touch the filesystem:
 
     - `user_input.log` - Natural language queries, user interactions, input validation
     - `calendar.log` - Google Calendar API requests, event data, timing information  
     - `gemini.log` - AI model prompts, responses, profile inference, and summarization
+                     (rotated at 10 MiB, keeping `gemini.log.1` .. `gemini.log.3`)
     - `system.log` - Runtime metrics, authentication flows, errors, and performance warnings
 
+    Records are not written by the calling thread. Each named logger only carries a
+    `QueueHandler` that pushes onto one shared in-memory queue; a single background
+    `QueueListener` thread owns the file handlers and performs all disk I/O. This keeps
+    log calls on the request path (e.g. `handle_user_query`) free of write latency.
+
+    The file handlers write through an 8 KiB buffer that is flushed once per second by a
+    shared daemon thread (and on shutdown) instead of after every record. Set
+    `CALENDAR_LOG_UNBUFFERED=1` to fall back to plain per-record flushing.
+
     Session Management:
     ------------------
     The logging system provides visual session boundaries with ASCII banners to clearly
@@ -52,12 +72,175 @@ from datetime import datetime
     ```
 """
 
-# Create a new log directory with timestamp for every new run
-timestamp_str = datetime.now().strftime("run_%Y-%m-%d_%H-%M-%S")
-LOG_DIR = os.path.join("logs", timestamp_str)
-os.makedirs(LOG_DIR, exist_ok=True)
+# The log format only uses asctime, levelname and message, so skip collecting
+# process/thread/task details for every LogRecord (logAsyncioTasks is 3.12+)
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
+
+# Run directory, created on first use (see _get_log_dir / __getattr__ below)
+_log_dir = None
+_init_lock = threading.Lock()
+
+
+def _get_log_dir():
+    """
+    Returns this run's log directory, creating it with a timestamped name on first call.
+    """
+    global _log_dir
+    if _log_dir is None:
+        # Create a new log directory with timestamp for every new run
+        timestamp_str = datetime.now().strftime("run_%Y-%m-%d_%H-%M-%S")
+        _log_dir = os.path.join("logs", timestamp_str)
+        os.makedirs(_log_dir, exist_ok=True)
+    return _log_dir
+
+# Shared queue between all loggers and the single listener thread that writes to disk
+_log_queue = queue.SimpleQueue()
+_listener = None
+
+# Names of loggers already wired up by setup_logger, and the formatter they all share
+_CONFIGURED = set()
+# An explicit datefmt skips the extra ",mmm" milliseconds formatting step
+_FMT = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
+
+# Buffered handlers that the background flusher thread should flush periodically
+_buffered_handlers = weakref.WeakSet()
+_flusher = None
+_flush_errors_reported = weakref.WeakSet()
+FLUSH_INTERVAL = 1.0
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        try:
+            handlers = list(_buffered_handlers)
+        except RuntimeError:
+            # A handler was registered while copying the set; try again next tick
+            continue
+        # One failing handler (e.g. disk full) must not stop flushing for the others
+        for handler in handlers:
+            try:
+                handler.flush()
+            except Exception:
+                _report_flush_error(handler)
+
+
+def _report_flush_error(handler):
+    """
+    Prints a failed periodic flush to stderr, once per handler, like `Handler.handleError`.
+    """
+    if logging.raiseExceptions and handler not in _flush_errors_reported:
+        _flush_errors_reported.add(handler)
+        sys.stderr.write(f"--- Logging error ---\nPeriodic flush failed for {handler!r}\n")
+        traceback.print_exc(file=sys.stderr)
+
+
+class _BufferedStreamMixin:
+    """
+    Shared stream setup for the buffered file handlers below.
+
+    The underlying file is opened unbuffered in binary append mode and wrapped in an
+    `io.BufferedWriter` of `buf_size` bytes. The handler is registered with the shared
+    daemon thread that flushes all buffered handlers every `FLUSH_INTERVAL` seconds;
+    `close()` (called by `logging.shutdown` at exit) flushes whatever remains.
+    """
+
+    def __init__(self, *args, buf_size=8192, **kwargs):
+        # Must be set before the base __init__, which may already call _open()
+        self.buf_size = buf_size
+        super().__init__(*args, **kwargs)
+        _start_flusher()
+        _buffered_handlers.add(self)
+
+    def _open(self):
+        raw = open(self.baseFilename, self.mode.replace("b", "") + "b", buffering=0)
+        buffered = io.BufferedWriter(raw, buffer_size=self.buf_size)
+        return io.TextIOWrapper(buffered, encoding=self.encoding, errors=self.errors)
+
+
+class BufferedFileHandler(_BufferedStreamMixin, logging.FileHandler):
+    """
+    FileHandler that buffers writes in memory instead of flushing after every record.
+    """
+
+    def __init__(self, filename, mode="a", encoding="utf-8", delay=False, buf_size=8192):
+        super().__init__(filename, mode, encoding=encoding, delay=delay, buf_size=buf_size)
+
+    def emit(self, record):
+        if self.stream is None:
+            if self.mode != "w" or not self._closed:
+                self.stream = self._open()
+        if not self.stream:
+            return
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BufferedRotatingFileHandler(_BufferedStreamMixin, logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler with the same buffered, periodically flushed stream as
+    BufferedFileHandler.
+
+    The stock `shouldRollover` seeks the stream to measure the file, which would flush the
+    buffer on every record, so the current size in bytes is tracked here instead.
+    """
+
+    def __init__(self, filename, max_bytes, backup_count, encoding="utf-8", buf_size=8192):
+        self._size = 0
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count,
+                         encoding=encoding, buf_size=buf_size)
+        self._size = self.stream.tell()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            # maxBytes is a byte limit, so measure the encoded record, not its characters
+            size = len(msg.encode(self.encoding, self.errors or "strict"))
+            if self.stream is None:
+                self.stream = self._open()
+                self._size = self.stream.tell()
+            if self.maxBytes > 0 and self._size > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                self._size = 0
+            self.stream.write(msg)
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
-def setup_logger(name, log_file, level=logging.INFO):
+
+def _start_flusher():
+    global _flusher
+    if _flusher is None:
+        _flusher = threading.Thread(target=_flush_loop, name="log-flusher", daemon=True)
+        _flusher.start()
+
+
+def _get_listener():
+    """
+    Returns the process-wide QueueListener, starting it on first use.
+
+    The listener is stopped at interpreter exit so queued records are drained to disk.
+    """
+    global _listener
+    if _listener is None:
+        _listener = logging.handlers.QueueListener(_log_queue, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+    return _listener
+
+
+def setup_logger(name, log_file, level=logging.INFO, rotating=False, max_bytes=0, backup_count=0):
     """
     Creates and configures a named logger instance with file output.
 
@@ -77,6 +260,13 @@ def setup_logger(name, log_file, level=logging.INFO):
                           Defaults to logging.INFO
                           Common values: DEBUG(10), INFO(20), WARNING(30), ERROR(40)
 
+    rotating (bool, optional): Roll the file over once it reaches `max_bytes`
+                               Defaults to False (single, unbounded file)
+
+    max_bytes (int, optional): Size limit per file when `rotating` is set
+
+    backup_count (int, optional): Number of rolled-over files to keep (`.1`, `.2`, ...)
+
     Returns:
     --------
     logging.Logger: Configured logger instance ready for use
@@ -86,34 +276,60 @@ def setup_logger(name, log_file, level=logging.INFO):
     ---------
     - Automatically creates parent directories for the log file path
     - Applies standardized timestamp format: 'YYYY-MM-DD HH:MM:SS | LEVEL | MESSAGE'
-    - Prevents duplicate handlers if the logger already exists
+    - Returns the existing logger untouched if `name` was already configured
     - Thread-safe for concurrent access across multiple modules
+    - The file handler is owned by the background listener thread; the returned logger
+      only enqueues records, so log calls never block on disk I/O
+    - Writes are buffered and flushed about once per second unless
+      `CALENDAR_LOG_UNBUFFERED=1` is set
 
     Notes:
     ------
     - Each logger name should be unique to avoid conflicts
     - Log files are opened in append mode, preserving previous entries
     """
-    
-    # Ensure the directory for the log file exists
+
+    # Already configured: skip building a second handler for the same logger
+    if name in _CONFIGURED:
+        return logging.getLogger(name)
+
+    # Ensure the directory for the log file exists (the run directory already does)
     log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
+    if log_dir and log_dir != _log_dir:
         os.makedirs(log_dir, exist_ok=True)
     
-    handler = logging.FileHandler(log_file)
-    formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s')
-    handler.setFormatter(formatter)
+    unbuffered = os.environ.get("CALENDAR_LOG_UNBUFFERED") == "1"
+    if rotating and unbuffered:
+        handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+    elif rotating:
+        handler = BufferedRotatingFileHandler(log_file, max_bytes, backup_count)
+    elif unbuffered:
+        handler = logging.FileHandler(log_file)
+    else:
+        handler = BufferedFileHandler(log_file)
+    handler.setFormatter(_FMT)
+    # The listener dispatches every queued record to every handler, so each file
+    # handler only accepts records coming from its own logger
+    handler.addFilter(logging.Filter(name))
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    
-    # Avoid adding duplicate handlers if already set
-    if not logger.hasHandlers():
-        logger.addHandler(handler)
+
+    listener = _get_listener()
+    listener.handlers = listener.handlers + (handler,)
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+    _CONFIGURED.add(name)
     return logger
 
 
 
+# Static lines of the session banner, built once instead of on every call
+_BANNER_BORDER = "#" * 80
+_BANNER_EMPTY = "# " + " " * 76 + "#"
+_BANNER_LABEL_SLOT = "\0LABEL\0"
+
+
 def log_session_start(logger, label="SESSION"):
     """
     Creates a visual session boundary marker in log files.
@@ -150,25 +366,77 @@ def log_session_start(logger, label="SESSION"):
     - The timestamp uses the system's local timezone
     """
 
+    log_session_start_all([(logger, label)])
+
+
+def log_session_start_all(loggers_and_labels):
+    """
+    Writes a session banner to several loggers, rendering the shared parts only once.
+
+    Every banner of a run carries the same timestamp, so the border, padding and TIME
+    lines are built a single time into a template; each logger then only fills in its
+    own centered label line. Each banner is still emitted as one record per logger.
+
+    Parameters:
+    -----------
+    loggers_and_labels (iterable): `(logger, label)` pairs, e.g.
+                                   `[(system_logger, "System Run"), (user_logger, "User Query")]`
+
+    Notes:
+    ------
+    - Output is identical to calling `log_session_start` for each pair, except that all
+      banners share one timestamp
+    """
+
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
-    block = (
-        "\n"
-        + "#" * 80 + "\n"
-        + "# " + " " * 76 + "#\n"
-        + f"# >>> {label.upper()} <<<".center(78) + " #\n"
-        + f"# TIME: {timestamp}".center(78) + " #\n"
-        + "# " + " " * 76 + "#\n"
-        + "#" * 80 + "\n"
-    )
+    template = "\n".join([
+        "",
+        _BANNER_BORDER,
+        _BANNER_EMPTY,
+        _BANNER_LABEL_SLOT,
+        f"# TIME: {timestamp}".center(78) + " #",
+        _BANNER_EMPTY,
+        _BANNER_BORDER,
+        "",
+    ])
+
+    for logger, label in loggers_and_labels:
+        label_line = f"# >>> {label.upper()} <<<".center(78) + " #"
+        logger.info(template.replace(_BANNER_LABEL_SLOT, label_line))
+
+# Define loggers: exported name -> (logger name, file inside LOG_DIR, extra setup_logger kwargs)
+# gemini.log holds full prompts/responses, so it rotates at 10 MiB keeping 3 backups
+_LAZY_LOGGERS = {
+    "user_logger": ("user_input", "user_input.log", {}),
+    "calendar_logger": ("calendar", "calendar.log", {}),
+    "gemini_logger": ("gemini", "gemini.log", {"rotating": True, "max_bytes": 10 << 20, "backup_count": 3}),
+    "system_logger": ("system", "system.log", {}),
+}
 
-    logger.info(block)
 
-# Define loggers
-user_logger = setup_logger("user_input", os.path.join(LOG_DIR, "user_input.log"))
-calendar_logger = setup_logger("calendar", os.path.join(LOG_DIR, "calendar.log"))
-gemini_logger = setup_logger("gemini", os.path.join(LOG_DIR, "gemini.log"))
-system_logger = setup_logger("system", os.path.join(LOG_DIR, "system.log"))
+def __getattr__(name):
+    """
+    Lazily creates `LOG_DIR` and the named loggers on first access (PEP 562).
+
+    Importing this module has no side effects; the run directory and its log files only
+    appear once something actually reads one of these attributes, e.g. via
+    `from logger import system_logger`. The value is then cached in the module globals,
+    so later lookups bypass this function entirely.
+    """
+    if name != "LOG_DIR" and name not in _LAZY_LOGGERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _init_lock:
+        if name in globals():
+            return globals()[name]
+        if name == "LOG_DIR":
+            value = _get_log_dir()
+        else:
+            logger_name, file_name, options = _LAZY_LOGGERS[name]
+            value = setup_logger(logger_name, os.path.join(_get_log_dir(), file_name), **options)
+        globals()[name] = value
+    return value
 
 # Export these so main.py can access them via `from logger import ...`
 __all__ = [
@@ -177,5 +445,6 @@ __all__ = [
     "gemini_logger",
     "system_logger",
     "log_session_start",
+    "log_session_start_all",
     "LOG_DIR"
 ]
\ No newline at end of file
@@ -1,13 +1,19 @@
+import logging
+import os
+import re
 import time
-from logger import setup_logger, log_session_start, user_logger, calendar_logger, gemini_logger, system_logger, LOG_DIR
+from logger import setup_logger, log_session_start_all, user_logger, calendar_logger, gemini_logger, system_logger, LOG_DIR
 from modules.calendar_handler import get_this_week_events, get_next_week_events, get_events_for_today, get_events_for_tomorrow
 from modules.gemini_handler import summarize_schedule, infer_user_profile_from_events
+from modules._cache import cached
 
 # Add visual boundaries at the top of each log file for this run
-log_session_start(system_logger, "System Run")
-log_session_start(user_logger, "User Query")
-log_session_start(gemini_logger, "Gemini Session")
-log_session_start(calendar_logger, "Calendar API")
+log_session_start_all([
+    (system_logger, "System Run"),
+    (user_logger, "User Query"),
+    (gemini_logger, "Gemini Session"),
+    (calendar_logger, "Calendar API"),
+])
 print(f"Logs for this run are saved in: {LOG_DIR}")
 
 """
@@ -48,6 +54,7 @@ print(f"Logs for this run are saved in: {LOG_DIR}")
     - `modules/gemini_handler.py` - AI-powered profile inference, event enrichment, and summarization
     - `modules/auth_handler.py` - OAuth 2.0 authentication flow for Google Calendar access
     - `modules/speech_input.py` - Speech-to-text capabilities (not yet implemented)
+    - `modules/_cache.py` - Short-lived on-disk cache for calendar fetches (`FORCE_REFRESH=1` bypasses)
     - `logger.py` - Comprehensive logging system with separate logs for different concerns
 
     Dependencies:
@@ -74,6 +81,20 @@ print(f"Logs for this run are saved in: {LOG_DIR}")
         * `calendar.log` - Calendar API requests, responses, and event data
 """
 
+# Supported keywords and the calendar fetcher / summary settings used for each.
+# Fetchers are wrapped in a short-lived on-disk cache (see modules/_cache.py).
+# Each entry is (keyword, fetcher, summary label, temperature).
+_HANDLERS = [
+    ("this week",   cached("this week")(get_this_week_events),      "this week",    0.3),
+    ("next week",   cached("next week")(get_next_week_events),      "next week",    0.3),
+    ("today",       cached("today")(get_events_for_today),          "today",        0.8),
+    ("tomorrow",    cached("tomorrow")(get_events_for_tomorrow),    "tomorrow",     0.8),
+]
+_HANDLER_BY_KEYWORD = {keyword: (func, label, temp) for keyword, func, label, temp in _HANDLERS}
+
+# Single-pass keyword matcher; the keyword appearing first in the query wins
+_KEYWORD_RE = re.compile(r"\b(" + "|".join(re.escape(keyword) for keyword, *_ in _HANDLERS) + r")\b")
+
 def handle_user_query(query: str):
     """
     Processes natural language user queries and returns appropriate calendar summaries.
@@ -84,8 +105,8 @@ def handle_user_query(query: str):
 
     Processing Pipeline:
     -------------------
-    1. Convert query to lowercase for case-insensitive matching
-    2. Iterate through supported keywords to find a match
+    1. Case-fold the query for case-insensitive matching (Unicode-aware)
+    2. Find the first supported keyword in the query with a single regex search
     3. Call appropriate calendar handler function to fetch events
     4. Generate user profile inference from event patterns using Gemini AI
     5. Summarize schedule with context-appropriate AI temperature setting
@@ -103,32 +124,27 @@ def handle_user_query(query: str):
 
     """
     
-    start_time = time.time()
-    query_lower = query.lower()
-
-    query_handlers = {
-        "this week":    {"func": get_this_week_events,    "label": "this week", "temp": 0.3},
-        "next week":    {"func": get_next_week_events,    "label": "next week", "temp": 0.3},
-        "today":        {"func": get_events_for_today,    "label": "today",     "temp": 0.8},
-        "tomorrow":     {"func": get_events_for_tomorrow, "label": "tomorrow",  "temp": 0.8},
-    }
+    start_ns = time.perf_counter_ns()
+    query_lower = query.casefold()
 
     try:
-        for keyword, handler in query_handlers.items():
-            if keyword in query_lower:
-                user_logger.info(f"Interpreted query as: '{keyword}'")  # Optional
-                events = handler["func"]()
-                profile = infer_user_profile_from_events(events)
-                result = summarize_schedule(events, profile, handler["label"], temperature=handler["temp"])
-
-                duration = round(time.time() - start_time, 2)
-                system_logger.info(f"[User Query] Processed in {duration} seconds")
-                if duration > 30:
-                    system_logger.warning(f"[Runtime] Slow response: {duration} seconds")
-                return result
-
-        # If no keyword matched:
-        system_logger.warning(f"[User Query] No recognizable keyword in query: '{query}'")
+        match = _KEYWORD_RE.search(query_lower)
+        if not match:
+            system_logger.warning(f"[User Query] No recognizable keyword in query: '{query}'")
+            return
+
+        keyword = match.group(1)
+        func, label, temp = _HANDLER_BY_KEYWORD[keyword]
+        user_logger.info("Interpreted query as: '%s'", keyword)  # Optional
+        events = func()
+        profile = infer_user_profile_from_events(events)
+        result = summarize_schedule(events, profile, label, temperature=temp)
+
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        system_logger.info(f"[User Query] Processed in {duration_ms / 1000:.2f} seconds")
+        if duration_ms > 30_000:
+            system_logger.warning(f"[Runtime] Slow response: {duration_ms / 1000:.2f} seconds")
+        return result
     
     except Exception as e:
         system_logger.error(f"[User Query] Error: {e}")
@@ -136,19 +152,26 @@ def handle_user_query(query: str):
 
 if __name__ == "__main__":
 
-    # Read user query from file
-    with open("user_data/user_responses.txt", "r") as f:
-        query = f.read().strip()
-        if not query:
-            system_logger.error("[User Query] Empty input detected.")
-        user_logger.info(f"User input: {query}")
+    # Read user query from file (usually a single raw read; loop until EOF for larger files)
+    fd = os.open("user_data/user_responses.txt", os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    query = b"".join(chunks).decode("utf-8").strip()
+    if not query:
+        system_logger.error("[User Query] Empty input detected.")
+    user_logger.info(f"User input: {query}")
 
     # Process and summarize the calendar schedule
     response = handle_user_query(query)
     
     # Log the final response
     gemini_logger.info("=" * 40)
-    gemini_logger.info(f"[FINAL RESPONSE]\n{response}")
+    if gemini_logger.isEnabledFor(logging.INFO):
+        gemini_logger.info("[FINAL RESPONSE]\n%s", response)
         
     print("\nGemini Response:\n")
     print(response)
\ No newline at end of file
@@ -0,0 +1,95 @@
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import date
+
+import logger
+
+"""
+    On-Disk TTL Cache for Calendar Fetches
+
+    Description:
+    ------------
+    Google Calendar `events.list` calls cost a full HTTPS round-trip on every run, while the
+    answer for a given time range rarely changes within a few minutes. This module provides
+    a small decorator that stores a fetcher's JSON result under `logs/cache/` and serves it
+    back on later runs until it expires.
+
+    Cache Keys:
+    -----------
+    Entries are keyed by the query label ("this week", "today", ...) and today's date, so a
+    cached "today" never survives past midnight. Each entry is one `<sha1>.json` file whose
+    modification time decides freshness.
+
+    Values are stored as JSON, so a cache hit returns JSON types: tuples come back as lists
+    and non-string dict keys as strings. Calendar API event lists are already plain JSON.
+
+    Environment:
+    ------------
+    - `FORCE_REFRESH=1` - Skip cached entries and always call the wrapped function
+                          (the fresh result is still written back to the cache)
+"""
+
+CACHE_DIR = os.path.join("logs", "cache")
+DEFAULT_TTL = 300
+
+
+def cached(label, ttl=DEFAULT_TTL):
+    """
+    Decorator that caches a zero-argument fetcher's result on disk for `ttl` seconds.
+
+    Parameters:
+    -----------
+    label (str): Query label the fetcher serves, e.g. "this week"
+    ttl (int, optional): Lifetime of a cache entry in seconds. Defaults to 300 (5 minutes)
+
+    Notes:
+    ------
+    - Results must be JSON serializable; anything else is returned uncached
+    - A `None` result (e.g. a fetcher's fallback after a failed API call) is never cached
+    - Cache hits return JSON types (lists instead of tuples, string dict keys)
+    - Writes go through a temporary file and `os.replace`, so readers never see partial JSON
+    - Any cache read/write failure falls back to calling the wrapped function
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper():
+            key = hashlib.sha1(f"{label}|{date.today().isoformat()}".encode()).hexdigest()
+            path = os.path.join(CACHE_DIR, f"{key}.json")
+
+            if os.environ.get("FORCE_REFRESH") != "1":
+                try:
+                    if time.time() - os.path.getmtime(path) < ttl:
+                        with open(path, "r", encoding="utf-8") as f:
+                            result = json.load(f)
+                        logger.calendar_logger.info(f"[Cache] Using cached events for '{label}'")
+                        return result
+                except (OSError, ValueError):
+                    pass
+
+            result = func()
+            if result is None:
+                return result
+
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(result, f)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except (OSError, TypeError, ValueError) as e:
+                logger.calendar_logger.warning(f"[Cache] Could not cache events for '{label}': {e}")
+
+            return result
+
+        return wrapper
+
+    return decorator
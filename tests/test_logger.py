@@ -0,0 +1,65 @@
+import glob
+import logging
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logger
+from logger import BufferedRotatingFileHandler
+
+
+class BufferedRotatingFileHandlerTest(unittest.TestCase):
+
+    def test_rolled_files_stay_within_max_bytes(self):
+        max_bytes = 1000
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "gemini.log")
+            handler = BufferedRotatingFileHandler(path, max_bytes, backup_count=3)
+            try:
+                # Multi-byte characters: 4 bytes each in UTF-8, 1 character in len()
+                for i in range(40):
+                    record = logging.LogRecord("gemini", logging.INFO, __file__, 0,
+                                               "response %d: %s", (i, "\U0001F389" * 20), None)
+                    handler.handle(record)
+            finally:
+                handler.close()
+
+            files = sorted(glob.glob(path + "*"))
+            self.assertEqual(len(files), 4)
+            for name in files:
+                self.assertLessEqual(os.path.getsize(name), max_bytes, name)
+
+
+class FlushLoopTest(unittest.TestCase):
+
+    def test_failed_flush_does_not_stop_flusher(self):
+        class FailingHandler(logging.Handler):
+            calls = 0
+
+            def flush(self):
+                self.calls += 1
+                raise OSError(28, "No space left on device")
+
+        failing = FailingHandler()
+        old_interval, old_raise = logger.FLUSH_INTERVAL, logging.raiseExceptions
+        logger.FLUSH_INTERVAL, logging.raiseExceptions = 0.01, False
+        try:
+            logger._start_flusher()
+            logger._buffered_handlers.add(failing)
+            # A second call proves the loop survived the first failure
+            deadline = time.monotonic() + 5
+            while failing.calls < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertGreaterEqual(failing.calls, 2)
+            self.assertTrue(logger._flusher.is_alive())
+        finally:
+            logger._buffered_handlers.discard(failing)
+            logger.FLUSH_INTERVAL, logging.raiseExceptions = old_interval, old_raise
+
+
+if __name__ == "__main__":
+    unittest.main()